@@ -1,15 +1,26 @@
-from fastapi import FastAPI, Path, HTTPException
-from typing import List
-from pydantic import BaseModel, Field , constr, field_validator
+from fastapi import FastAPI, Path, HTTPException, Response
+from fastapi.exceptions import RequestValidationError
+from fastapi.exception_handlers import request_validation_exception_handler
+from fastapi.responses import ORJSONResponse
+from typing import Annotated, List
+from pydantic import BaseModel, Field , PrivateAttr, StringConstraints, field_validator, model_validator
 from azure.core.credentials import AzureKeyCredential
+from azure.core.exceptions import ResourceNotFoundError
+from azure.core.pipeline.transport import RequestsTransport
 from azure.search.documents.indexes import SearchIndexClient
 from azure.search.documents.indexes.models import SynonymMap
 from azure.search.documents import SearchClient
 from collections import OrderedDict
 from dotenv import load_dotenv 
+from requests.adapters import HTTPAdapter
 from rich import print as pprint
 import os  
+import orjson
+import requests
 import logging
+import asyncio
+import itertools
+import time
 
 # Set the logging level to INFO
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
@@ -29,137 +40,183 @@ load_dotenv()
 # Function to initialize Azure Search Index Client
 service_endpoint = os.getenv("AZURE_SEARCH_SERVICE_ENDPOINT")
 key = os.getenv("AZURE_SEARCH_ADMIN_KEY")
-search_index_client = SearchIndexClient(service_endpoint, AzureKeyCredential(key))
+# Name of the index field the synonym maps are attached to
+FIELD_NAME = os.getenv("AZURE_SEARCH_INDEX_FIELD_NAME")
+# Share one pooled HTTP session across all requests to Azure AI Search
+session = requests.Session()
+adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, pool_block=False)
+session.mount("https://", adapter)
+session.mount("http://", adapter)
+search_index_client = SearchIndexClient(service_endpoint, AzureKeyCredential(key), transport=RequestsTransport(session=session, session_owner=False))
+
+# Bounded TTL cache for the index / synonym map existence checks done by the validators
+EXISTS_CACHE_TTL = 60
+NOT_FOUND_CACHE_TTL = 5
+EXISTS_CACHE_MAXSIZE = 256
+_exists_cache = OrderedDict()
+
+def _store_exists(cacheKey, exists, ttl):
+    _exists_cache[cacheKey] = (exists, time.monotonic() + ttl)
+    _exists_cache.move_to_end(cacheKey)
+    # Evict the least recently used entry so client-chosen names cannot grow the cache without limit
+    if len(_exists_cache) > EXISTS_CACHE_MAXSIZE:
+        _exists_cache.popitem(last=False)
+
+def _cached_exists(kind, name, fetch, cacheFound=True):
+    cacheKey = (kind, name)
+    cached = _exists_cache.get(cacheKey)
+    if cached is not None:
+        if cached[1] > time.monotonic():
+            _exists_cache.move_to_end(cacheKey)
+            return cached[0]
+        del _exists_cache[cacheKey]
+    try:
+        fetch(name)
+    except ResourceNotFoundError:
+        # Cache misses for a short time so bad input does not hammer Azure
+        _store_exists(cacheKey, False, NOT_FOUND_CACHE_TTL)
+        return False
+    except Exception as e:
+        # Do not cache transient errors
+        logging.error(str(e))
+        return False
+    if cacheFound:
+        _store_exists(cacheKey, True, EXISTS_CACHE_TTL)
+    return True
+
+def _index_exists(name):
+    return _cached_exists("index", name, search_index_client.get_index)
+
+def _synonym_map_exists(name):
+    # Only misses are cached: this check guards update-synonym-map, and a stale hit in one
+    # worker would let an update recreate a map that another worker just deleted
+    return _cached_exists("synonym_map", name, search_index_client.get_synonym_map, cacheFound=False)
+
+# LRU cache of parsed synonym rules keyed by (map name, etag)
+PARSE_CACHE_MAXSIZE = 128
+_parse_cache = OrderedDict()
+
+def _parse_synonym_rules(synonymMap):
+    cacheKey = (synonymMap.name, synonymMap.e_tag)
+    if synonymMap.e_tag is not None and cacheKey in _parse_cache:
+        _parse_cache.move_to_end(cacheKey)
+        return _parse_cache[cacheKey]
+    synonymList = [list(map(str.strip, synonym.split(","))) for synonym in synonymMap.synonyms]
+    if synonymMap.e_tag is not None:
+        _parse_cache[cacheKey] = synonymList
+        if len(_parse_cache) > PARSE_CACHE_MAXSIZE:
+            _parse_cache.popitem(last=False)
+    return synonymList
+
+def _invalidate_synonym_map(name):
+    _exists_cache.pop(("synonym_map", name), None)
+    for cacheKey in [cacheKey for cacheKey in _parse_cache if cacheKey[0] == name]:
+        del _parse_cache[cacheKey]
 
 app = FastAPI()
 
+# Warm up the connection pool and auth before serving the first request
+@app.on_event("startup")
+async def warm_up_search_index_client():
+    try:
+        await asyncio.to_thread(search_index_client.get_service_statistics)
+    except Exception as e:
+        logging.error(str(e))
+
+# Log request validation errors once, then return FastAPI's default 422 response
+@app.exception_handler(RequestValidationError)
+async def log_validation_error(request, exc):
+    # Log only where and why validation failed, not the (possibly large) client input
+    logging.error(f"Validation error on {request.url.path}: {[(error['loc'], error['msg']) for error in exc.errors()]}")
+    return await request_validation_exception_handler(request, exc)
+
+# Synonym map names are 1-10 characters and always stored in lowercase
+MapName = Annotated[str, StringConstraints(min_length=1, max_length=10, to_lower=True)]
+
+# Shared validator for the synonymList field of SynonymData and UpdatedSynonymData
+def _validate_synonym_list(cls, v):
+    # check if SynonymList is not empty
+    if not v:
+        raise ValueError("SynonymList cannot be empty")
+    for subSynonymList in v:
+        # check if subSynonymList is a list with at least two elements
+        if not isinstance(subSynonymList, list) or len(subSynonymList) < 2:
+            raise ValueError("SubSynonymList should contain at least two non-empty elements")
+        # check if elements of the List are non-empty string
+        if not all(isinstance(element, str) and element for element in subSynonymList):
+            raise ValueError("SubSynonymList's elements should be non-empty string")
+    return v
+
+# Join each validated sub list into an equivalency rule once, so handlers can reuse them
+def _build_synonym_rules(self):
+    self._rules = [", ".join(synonymOneList) for synonymOneList in self.synonymList]
+    return self
+
 class SynonymData(BaseModel):
     indexName: str
-    mapName: constr(min_length=1 , max_length=10)
+    mapName: MapName
     # Convert explicit mapping to equivalency mapping
     synonymList: List[List[str]] = []
+    _rules: List[str] = PrivateAttr(default_factory=list)
 
     @field_validator("indexName")
     # check if indexName exists in Azure AI Search
     def check_indexName(cls, v):
-        try:
-            search_index_client.get_index(v)
-        except Exception as e:
-            logging.error(str(e))
+        if not _index_exists(v):
             raise ValueError("IndexName does not exist in Azure AI Search")
         return v
 
-    @field_validator("mapName")
-    def check_mapName(cls, v):
-        if v != v.lower():
-            logging.error("MapName should be in Lowercase")
-            raise ValueError("MapName should be in Lowercase")
-        return v
-
-    @field_validator("synonymList")
-    def check_synonym_list(cls, v):
-        # check if SynonymList is not empty
-        if not v or len(v) < 1:
-            logging.error("SynonymList cannot be empty")
-            raise ValueError("SynonymList cannot be empty")
-        for subSynonymList in v:
-            # cehck if subSynonymList is not empty and whose length is greater than 1
-            if not isinstance(subSynonymList,list) or not subSynonymList or not len(subSynonymList) > 1:
-                logging.error("SubSynonymList should contain at least two non-empty elements")
-                raise ValueError("SubSynonymList should contain at least two non-empty elements")
-            else:
-                # check if elements of the List are non-empty string
-                for element in subSynonymList:
-                    if not isinstance(element, str) or not element:
-                        logging.error("SubSynonymList's elements should be non-empty string")
-                        raise ValueError("SubSynonymList's elements should be non-empty string")
-        return v
+    check_synonym_list = field_validator("synonymList")(_validate_synonym_list)
+    build_synonym_rules = model_validator(mode="after")(_build_synonym_rules)
     
     
 
 class ReadSynonymData(BaseModel):
-    mapName: constr(min_length=1 , max_length=10)
+    mapName: MapName
     synonymList: List[List[str]] = []
 
 class UpdatedSynonymData(BaseModel):
     indexName: str
-    mapName: constr(min_length=1 , max_length=10)
+    mapName: MapName
     synonymList: List[List[str]] = []
+    _rules: List[str] = PrivateAttr(default_factory=list)
 
     @field_validator("indexName")
     # check if indexName exists in Azure AI Search
     def check_indexName(cls, v):
-        try:
-            search_index_client.get_index(v)
-        except Exception as e:
-            logging.error(str(e))
+        if not _index_exists(v):
             raise ValueError("IndexName does not exist in Azure AI Search")
         return v
 
     @field_validator("mapName")
     def check_mapName(cls, v):
-        if v != v.lower():
-            logging.error("MapName should be in Lowercase")
-            raise ValueError("MapName should be in Lowercase")
-        try:
-            search_index_client.get_synonym_map(v)
-        except Exception as e:
-            logging.error(str(e))
+        if not _synonym_map_exists(v):
             raise ValueError("MapName does not exist in Azure AI Search")
         return v
 
-    @field_validator("synonymList")
-    def check_synonym_list(cls, v):
-        # check if SynonymList is not empty
-        if not v or len(v) < 1:
-            logging.error("SynonymList cannot be empty")
-            raise ValueError("SynonymList cannot be empty")
-        for subSynonymList in v:
-            # cehck if subSynonymList is not empty and whose length is greater than 1
-            if not isinstance(subSynonymList,list) or not subSynonymList or not len(subSynonymList) > 1:
-                logging.error("SubSynonymList should contain at least two non-empty elements")
-                raise ValueError("SubSynonymList should contain at least two non-empty elements")
-            else:
-                # check if elements of the List are non-empty string
-                for element in subSynonymList:
-                    if not isinstance(element, str) or not element:
-                        logging.error("SubSynonymList's elements should be non-empty string")
-                        raise ValueError("SubSynonymList's elements should be non-empty string")
-        return v
+    check_synonym_list = field_validator("synonymList")(_validate_synonym_list)
+    build_synonym_rules = model_validator(mode="after")(_build_synonym_rules)
 
 class ReadSynonymDataByIndexName(BaseModel):
     indexName: str
     @field_validator("indexName")
     # check if indexName exists in Azure AI Search
     def check_indexName(cls, v):
-        try:
-            search_index_client.get_index(v)
-        except Exception as e:
-            logging.error(str(e))
+        if not _index_exists(v):
             raise ValueError("IndexName does not exist in Azure AI Search")
         return v
 
 class DeleteSynonymData(BaseModel):
     indexName: str
-    mapName: constr(min_length=1 , max_length=10)
+    mapName: MapName
 
     @field_validator("indexName")
     # check if indexName exists in Azure AI Search
     def check_indexName(cls, v):
-        try:
-            search_index_client.get_index(v)
-        except Exception as e:
-            logging.error(str(e))
+        if not _index_exists(v):
             raise ValueError("IndexName does not exist in Azure AI Search")
         return v
 
-    @field_validator("mapName")
-    def check_mapName(cls, v):
-        if v != v.lower():
-            logging.error("MapName should be in Lowercase")
-            raise ValueError("MapName should be in Lowercase")
-        return v
-
 # Define ResponseModel with data attribute as Field
 class ResponseModel(BaseModel):
     code: int
@@ -180,187 +237,146 @@ status_codes = {
     500: "Internal Server Error"
 }
 
+# Pre-serialized body returned by the write endpoints on success
+SUCCESS_BYTES = orjson.dumps({"code": 200, "message": status_codes.get(200), "data": []})
+
 # Endpoint to get all synonyms by indexName
-@app.get("/get-all-synonymmaps")
-def get_all_synonymmaps():
+@app.get("/get-all-synonymmaps", response_class=ORJSONResponse, response_model=None)
+async def get_all_synonymmaps():
     try:
         search_index_client
         # Retrieve all synonym maps
-        synonymMapNameList = search_index_client.get_synonym_maps()
+        synonymMapNameList = await asyncio.to_thread(search_index_client.get_synonym_maps)
         # Extract names of synonym maps
         names = [synonymMapName.name for synonymMapName in synonymMapNameList]
         # print(names)
-        # Initialize response object
-        response = ResponseModel(code=200, message=status_codes.get(200))
-        # Iterate over each synonym map
-        for i, name in enumerate(names):
-            # Add synonym map to response data
-            response.data.append(ReadSynonymData(mapName=name, data=[]))
-            # Retrieve details of the synonym map
-            synonymMap = search_index_client.get_synonym_map(name)
-            # Iterate over each synonym in the synonym map
-            # Test Convert explicit mapping to equivalency mapping
-            # for j, synonym_format_str in enumerate(synonymMap.synonyms):
-            #     # Extract destination synonym word and source synonym word list
-            #     destination_synonym_str = synonym_format_str.split("=>")[1].strip()
-            #     source_synonym_str_list = [element.strip() for element in synonym_format_str.split("=>")[0].split(",")]
-            #     # Add synonym mapping to response data
-            #     response.data[i].synonymKeyValue.append({destination_synonym_str: source_synonym_str_list})
-            for j, synonym_format_str in enumerate(synonymMap.synonyms):
-                # Extract destination synonym word and source synonym word list
-                source_synonym_str_list = [element.strip() for element in synonym_format_str.split(",")]
-                # Add synonym mapping to response data
-                response.data[i].synonymList.append(source_synonym_str_list)
-        return response
+        # Retrieve details of all synonym maps concurrently
+        synonymMaps = await asyncio.gather(*(asyncio.to_thread(search_index_client.get_synonym_map, name) for name in names))
+        # Build response data as plain dicts, splitting each rule into its synonyms
+        data = [
+            {"mapName": name, "synonymList": _parse_synonym_rules(synonymMap)}
+            for name, synonymMap in zip(names, synonymMaps)
+        ]
+        return ORJSONResponse({"code": 200, "message": status_codes.get(200), "data": data})
     except Exception as e:
         # Handle exceptions and return error response
         logging.error(str(e))
-        error_response = ResponseModel(code=500, message=str(e))
-        return error_response
+        return ORJSONResponse({"code": 500, "message": str(e), "data": []})
     
 # Endpoint of get synonym map by Azure search index name
-@app.post("/get-synonymmap-by-aisearchindexname")
-# def get_synonymmap_by_aisearchindexname(indexName: str):
-def get_synonymmap_by_aisearchindexname(readSynonymDataByIndexName: ReadSynonymDataByIndexName):
+@app.post("/get-synonymmap-by-aisearchindexname", response_class=ORJSONResponse, response_model=None)
+async def get_synonymmap_by_aisearchindexname(readSynonymDataByIndexName: ReadSynonymDataByIndexName):
     try:
         # Initialize Azure Search Index Client
-        index = search_index_client.get_index(readSynonymDataByIndexName.indexName)
-        synonymMapNameList = []
+        index = await asyncio.to_thread(search_index_client.get_index, readSynonymDataByIndexName.indexName)
         synonymNameMappingList = []
 
-        # retrieve synonym maps associated with the index
-        for i, field in enumerate(index.fields):
-            if field.synonym_map_names is not None and len(field.synonym_map_names) > 0:
-                for synonymMapName in field.synonym_map_names:
-                    synonymMapNameList.append(synonymMapName)
-        # Remove duplicates from the list of synonym map names
-        # temp_list = list(set(temp_list))
-        synonymMapNameList = list(OrderedDict.fromkeys(synonymMapNameList))
+        # retrieve synonym maps associated with the index, removing duplicates
+        synonymMapNameList = list(dict.fromkeys(itertools.chain.from_iterable(field.synonym_map_names or () for field in index.fields)))
 
         # If synonym maps exists, retrieve their details
         if(len(synonymMapNameList)>0):
-            for i, name in enumerate(synonymMapNameList):
-                synonymNameMappingList.append(search_index_client.get_synonym_map(name))
-
-        # Create response model and populate with synonym map details
-        response = ResponseModel(code=200, message=status_codes.get(200))
-        # for i, synonymNameMapping in enumerate(synonymNameMappingList):
-        #     response.data.append(SynonymData(indexName=indexName, mapName=synonymNameMapping.name, data=[]))
-        #     for synonym in synonymNameMapping.synonyms:
-        #         synonym_str = ''.join(synonym)
-        #         destination_synonym_str = synonym_str.split("=>")[1].strip()
-        #         source_synonym_str_list = [element.strip() for element in synonym_str.split("=>")[0].split(",")]
-        #         response.data[i].synonymKeyValue.append({destination_synonym_str: source_synonym_str_list})
-        for i, synonymNameMapping in enumerate(synonymNameMappingList):
-            response.data.append(SynonymData(indexName=readSynonymDataByIndexName.indexName, mapName=synonymNameMapping.name, data=[]))
-            for synonym in synonymNameMapping.synonyms:
-                source_synonym_str_list = [element.strip() for element in synonym.split(",")]
-                response.data[i].synonymList.append(source_synonym_str_list)
-        return response
+            synonymNameMappingList = await asyncio.gather(*(asyncio.to_thread(search_index_client.get_synonym_map, name) for name in synonymMapNameList))
+
+        # Build response data as plain dicts with synonym map details
+        data = [
+            {
+                "indexName": readSynonymDataByIndexName.indexName,
+                "mapName": synonymNameMapping.name,
+                "synonymList": _parse_synonym_rules(synonymNameMapping),
+            }
+            for synonymNameMapping in synonymNameMappingList
+        ]
+        return ORJSONResponse({"code": 200, "message": status_codes.get(200), "data": data})
     except Exception as e:
         logging.error(str(e))
-        error_response = ResponseModel(code=500, message=str(e))
-        return error_response
+        return ORJSONResponse({"code": 500, "message": str(e), "data": []})
     
 # Endpoint to create synonym map    
 @app.post("/create-synonym-map")
-def create_synonym_map(synonymData: SynonymData):
-    synonymEquivalencyRules = []
+async def create_synonym_map(synonymData: SynonymData):
     try:
         # Check if synonym map already exists
-        index = search_index_client.get_index(synonymData.indexName)
-        # Construct synonym map strings
-        # for i, synonymMapKeyValue in enumerate(synonymData.synonymKeyValue):
-        #     for key, value in synonymMapKeyValue.items():
-        #         source_synonym = ", ".join(value)
-        #         destination_synonym = key
-        #         synonymMapList.append(f"{source_synonym} => {destination_synonym}")
-        for i, synonymOneList in enumerate(synonymData.synonymList):
-            synonymEquivalencyStr = ", ".join(synonymOneList)
-            synonymEquivalencyRules.append(synonymEquivalencyStr)
-
-        # Create synonym map
-        search_index_client.create_synonym_map(SynonymMap(name=synonymData.mapName, synonyms=synonymEquivalencyRules))
+        index = await asyncio.to_thread(search_index_client.get_index, synonymData.indexName)
+        # Create synonym map from the rules joined during validation
+        await asyncio.to_thread(search_index_client.create_synonym_map, SynonymMap(name=synonymData.mapName, synonyms=synonymData._rules))
+        _invalidate_synonym_map(synonymData.mapName)
         logging.info(f"Synonym map {synonymData.mapName} created successfully")
         # Flag to indicate if the index was updated
         ifIndexChanged = False
         # Iterate through index fields to add the synonym map name
-        for i, field in enumerate(index.fields):
-            if index.fields[i].name == os.getenv("AZURE_SEARCH_INDEX_FIELD_NAME"):
+        for field in index.fields:
+            if field.name == FIELD_NAME:
                 # Add the synonym map name if it does not exist in the field
-                if synonymData.mapName not in index.fields[i].synonym_map_names:
-                    index.fields[i].synonym_map_names.append(synonymData.mapName)
+                if synonymData.mapName not in field.synonym_map_names:
+                    field.synonym_map_names.append(synonymData.mapName)
                     ifIndexChanged = True
 
         # Update the index if any changes were made
         if ifIndexChanged:
-            search_index_client.create_or_update_index(index)
+            await asyncio.to_thread(search_index_client.create_or_update_index, index)
             logging.info(f"Synonym map {synonymData.mapName} added to {synonymData.indexName} index")
-            return ResponseModel(code=200, message=status_codes.get(200))
+            return Response(content=SUCCESS_BYTES, media_type="application/json")
         else:
             logging.info(f"Synonym map {synonymData.mapName} already exists in {synonymData.indexName} index")
-            return ResponseModel(code=200, message=f"Synonym map {synonymData.mapName} already exists in {synonymData.indexName} index")
+            return ResponseModel.model_construct(code=200, message=f"Synonym map {synonymData.mapName} already exists in {synonymData.indexName} index", data=[])
     except Exception as e:
         logging.error(str(e))
-        error_response = ResponseModel(code=500, message=str(e), data=[])
+        error_response = ResponseModel.model_construct(code=500, message=str(e), data=[])
         return error_response
     
 # Endpoint to delete synonym map 
 @app.delete("/delete-synonym-map")
-def delete_synonym_map(deleteSynonymData:DeleteSynonymData):
+async def delete_synonym_map(deleteSynonymData:DeleteSynonymData):
     search_index_client
     try:
         # Get the index
-        index = search_index_client.get_index(deleteSynonymData.indexName)
+        index = await asyncio.to_thread(search_index_client.get_index, deleteSynonymData.indexName)
         # Delete the synonym map
-        search_index_client.delete_synonym_map(deleteSynonymData.mapName)
+        await asyncio.to_thread(search_index_client.delete_synonym_map, deleteSynonymData.mapName)
+        _invalidate_synonym_map(deleteSynonymData.mapName)
         # Flag to indicate if the index was updated
         ifIndexChanged = False
         # Iterate through index fields to remove the synonym map name
-        for i, field in enumerate(index.fields):
-            if index.fields[i].synonym_map_names is not None and len(field.synonym_map_names) > 0 and index.fields[i].name in [os.getenv("AZURE_SEARCH_INDEX_FIELD_NAME")]:
-                    # Remove the synonym map name if it exists in the field
-                    if deleteSynonymData.mapName in index.fields[i].synonym_map_names:
-                        index.fields[i].synonym_map_names.remove(deleteSynonymData.mapName)
-                        logging.info(f"Synonym map {deleteSynonymData.mapName} removed from {deleteSynonymData.indexName} index")
-                        ifIndexChanged = True
+        for field in index.fields:
+            if field.name == FIELD_NAME and field.synonym_map_names:
+                # Remove the synonym map name if it exists in the field
+                if deleteSynonymData.mapName in field.synonym_map_names:
+                    field.synonym_map_names.remove(deleteSynonymData.mapName)
+                    logging.info(f"Synonym map {deleteSynonymData.mapName} removed from {deleteSynonymData.indexName} index")
+                    ifIndexChanged = True
         # Update the index if any changes were made
         if ifIndexChanged:
-            search_index_client.create_or_update_index(index)
+            await asyncio.to_thread(search_index_client.create_or_update_index, index)
             logging.info(f"Synonym map {deleteSynonymData.mapName} removed from {deleteSynonymData.indexName} index")
-            return ResponseModel(code=200, message=status_codes.get(200))
+            return Response(content=SUCCESS_BYTES, media_type="application/json")
         else:
             logging.info(f"Synonym map not found in {deleteSynonymData.indexName} index")
-            return ResponseModel(code=200, message=f"Synonym map not found in {deleteSynonymData.indexName} index")
+            return ResponseModel.model_construct(code=200, message=f"Synonym map not found in {deleteSynonymData.indexName} index", data=[])
     except Exception as e:
         # Handle exceptions and return error response
         logging.error(str(e))
-        error_response = ResponseModel(code=500, message=str(e))
+        error_response = ResponseModel.model_construct(code=500, message=str(e), data=[])
         return error_response
 
 # Endpoint to update synonym map
 @app.put("/update-synonym-map")
-def update_synonym_map(updatedSynonymData: UpdatedSynonymData):
-    synonymEquivalencyRules = []
+async def update_synonym_map(updatedSynonymData: UpdatedSynonymData):
     try:
-        index = search_index_client.get_index(updatedSynonymData.indexName)
-        for i, synonymOneList in enumerate(updatedSynonymData.synonymList):
-            synonymEquivalencyStr = ", ".join(synonymOneList)
-            synonymEquivalencyRules.append(synonymEquivalencyStr)
+        index = await asyncio.to_thread(search_index_client.get_index, updatedSynonymData.indexName)
 
-        search_index_client.create_or_update_synonym_map(SynonymMap(name=updatedSynonymData.mapName, synonyms=synonymEquivalencyRules))
+        await asyncio.to_thread(search_index_client.create_or_update_synonym_map, SynonymMap(name=updatedSynonymData.mapName, synonyms=updatedSynonymData._rules))
+        _invalidate_synonym_map(updatedSynonymData.mapName)
         logging.info(f"Synonym map {updatedSynonymData.mapName} updated successfully")
-        return ResponseModel(code=200, message=status_codes.get(200))
+        return Response(content=SUCCESS_BYTES, media_type="application/json")
     except Exception as e:
         logging.error(str(e))
-        error_response = ResponseModel(code=500, message=str(e), data=[])
+        error_response = ResponseModel.model_construct(code=500, message=str(e), data=[])
         return error_response
-    
-        
-        
-
-
-
-
-    
 
+# Run with: uvicorn main:app --workers N --loop uvloop --http httptools
+# "auto" resolves to uvloop and httptools whenever they are installed
+# The existence and parse caches are per process, so extra workers are opt-in via WEB_CONCURRENCY
+if __name__ == "__main__":
+    import uvicorn
+    uvicorn.run("main:app", loop="auto", http="auto", workers=int(os.getenv("WEB_CONCURRENCY", "1")))